@@ -1,13 +1,20 @@
 """
 Flask backend for QC Metrics Dashboard.
-Run:  python app.py
+Run:  python app.py        (waitress, WSGI_THREADS worker threads)
 """
 
+import decimal
+import glob
+import hashlib
 import os
 import threading
+import uuid
 import webbrowser
 
+import orjson
 from flask import Flask, request, jsonify, send_from_directory
+from flask_compress import Compress
+from waitress import serve
 from database import QCDatabase
 
 # ── paths ────────────────────────────────────────────────────────
@@ -16,10 +23,78 @@ FRONTEND_DIR = os.path.join(BASE_DIR, "..", "frontend")
 UPLOAD_DIR = os.path.join(BASE_DIR, "uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# concurrent requests served; each thread queries DuckDB through its own cursor
+WSGI_THREADS = 8
+
 # ── app setup ────────────────────────────────────────────────────
 app = Flask(__name__, static_folder=FRONTEND_DIR)
+Compress(app)                                  # gzip JSON / static responses
 db = QCDatabase()
 
+
+def _orjson_default(obj):
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    raise TypeError
+
+
+def ojson(obj, status=200):
+    """Fast JSON response via orjson (large row / stats payloads)."""
+    return app.response_class(
+        orjson.dumps(
+            obj,
+            default=_orjson_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ),
+        status=status,
+        mimetype="application/json",
+    )
+
+
+def filters_etag(filters: dict) -> str:
+    """ETag for a filtered response: endpoint, dataset tag and active filters."""
+    key = orjson.dumps(filters, option=orjson.OPT_SORT_KEYS)
+    return hashlib.md5(f"{request.path}:{db.dataset_etag}:".encode() + key).hexdigest()
+
+
+def not_modified(etag: str) -> bool:
+    """True when the client already holds the response tagged ``etag``."""
+    # Flask-Compress suffixes the tag of compressed bodies (e.g. "<tag>:gzip")
+    sent = request.if_none_match.as_set(include_weak=True)
+    return any(tag.split(":")[0] == etag for tag in sent)
+
+
+def tagged(resp, etag: str):
+    resp.set_etag(etag)
+    return resp
+
+
+def save_upload(f, prefix: str) -> str:
+    """Save an upload under a fresh name.
+
+    The DuckDB views read their parquet file on every query, so a new upload
+    must never overwrite the file that in-flight requests are reading.
+    """
+    filepath = os.path.join(UPLOAD_DIR, f"{prefix}-{uuid.uuid4().hex}.parquet")
+    f.save(filepath)
+    return filepath
+
+
+def remove_upload(filepath):
+    """Best-effort delete of an upload that no view reads any more."""
+    if filepath and os.path.exists(filepath):
+        try:
+            os.remove(filepath)
+        except OSError:
+            pass                # e.g. still open on Windows; harmless leftover
+
+
+# a fresh process has no views, so uploads left by an earlier run are stale
+for prefix in ("current", "new_samples"):
+    for stale in glob.glob(os.path.join(UPLOAD_DIR, f"{prefix}-*.parquet")):
+        remove_upload(stale)
+
+
 # ── static file serving ─────────────────────────────────────────
 
 @app.route("/")
@@ -49,14 +124,16 @@ def upload():
     if not f.filename or not f.filename.lower().endswith(".parquet"):
         return jsonify({"error": "File must be a .parquet file"}), 400
 
-    filepath = os.path.join(UPLOAD_DIR, "current.parquet")
-    f.save(filepath)
+    previous = db.sources.get("qc_data")
+    filepath = save_upload(f, "current")
 
     try:
         info = db.load_parquet(filepath)
-        return jsonify({"success": True, **info})
     except Exception as e:
+        remove_upload(filepath)
         return jsonify({"error": str(e)}), 500
+    remove_upload(previous)
+    return jsonify({"success": True, **info})
 
 
 @app.route("/upload-new-samples", methods=["POST"])
@@ -69,24 +146,25 @@ def upload_new_samples():
     if not f.filename or not f.filename.lower().endswith(".parquet"):
         return jsonify({"error": "File must be a .parquet file"}), 400
 
-    filepath = os.path.join(UPLOAD_DIR, "new_samples.parquet")
-    f.save(filepath)
+    previous = db.sources.get("new_samples")
+    filepath = save_upload(f, "new_samples")
 
     try:
         info = db.load_new_samples(filepath)
-        return jsonify({"success": True, **info})
     except Exception as e:
+        remove_upload(filepath)
         return jsonify({"error": str(e)}), 500
+    remove_upload(previous)
+    return jsonify({"success": True, **info})
 
 
 @app.route("/clear-new-samples", methods=["POST"])
 def clear_new_samples():
     """Remove new samples data."""
     try:
+        previous = db.sources.get("new_samples")
         db.clear_new_samples()
-        filepath = os.path.join(UPLOAD_DIR, "new_samples.parquet")
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        remove_upload(previous)
         return jsonify({"success": True})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -97,7 +175,10 @@ def filters():
     """Return current filter options."""
     if not db.loaded:
         return jsonify({"error": "No data loaded. Upload a parquet file first."}), 400
-    return jsonify(db.get_filter_options())
+    with db.reading():
+        if not_modified(db.dataset_etag):
+            return tagged(app.response_class(status=304), db.dataset_etag)
+        return tagged(ojson(db.get_filter_options()), db.dataset_etag)
 
 
 @app.route("/query", methods=["POST"])
@@ -109,19 +190,22 @@ def query():
     body = request.get_json(silent=True) or {}
     filters = body.get("filters", {})
 
-    try:
-        result = db.query_data(filters)
-        data = result["data"]
-        new_data = result["new_data"]
-        return jsonify({
-            "data": data,
-            "new_data": new_data,
-            "count": len(data),
-            "new_count": len(new_data),
-            "total": db.total_rows,
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    with db.reading():
+        etag = filters_etag(filters)
+        if not_modified(etag):
+            return tagged(app.response_class(status=304), etag)
+
+        try:
+            result = db.query_data(filters)
+            return tagged(ojson({
+                "data": result["data"],
+                "new_data": result["new_data"],
+                "count": result["count"],
+                "new_count": result["new_count"],
+                "total": db.total_rows,
+            }), etag)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
 
 
 @app.route("/stats", methods=["POST"])
@@ -134,11 +218,41 @@ def stats():
     filters = body.get("filters", {})
 
     try:
-        return jsonify(db.get_stats(filters))
+        return ojson(db.get_stats(filters))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/dashboard_state", methods=["POST"])
+def dashboard_state():
+    """Return filtered rows, box-plot statistics and filter options in one call."""
+    if not db.loaded and not db.new_samples_loaded:
+        return jsonify({"error": "No data loaded. Upload a parquet file first."}), 400
+
+    body = request.get_json(silent=True) or {}
+    filters = body.get("filters", {})
+
+    with db.reading():
+        etag = filters_etag(filters)
+        if not_modified(etag):
+            return tagged(app.response_class(status=304), etag)
+
+        try:
+            where = db._build_where(filters)
+            result = db.query_data(filters, _where=where)
+            return tagged(ojson({
+                "data": result["data"],
+                "new_data": result["new_data"],
+                "count": result["count"],
+                "new_count": result["new_count"],
+                "total": db.total_rows,
+                "stats": db.get_stats(filters, _where=where),
+                "filters": db.get_filter_options(),
+            }), etag)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+
 # ── startup ──────────────────────────────────────────────────────
 
 def open_browser():
@@ -148,4 +262,4 @@ def open_browser():
 if __name__ == "__main__":
     print("🧬  QC Metrics Dashboard running at http://127.0.0.1:5000")
     threading.Timer(1.2, open_browser).start()
-    app.run(host="127.0.0.1", port=5000, debug=False)
+    serve(app, host="127.0.0.1", port=5000, threads=WSGI_THREADS)
@@ -3,175 +3,241 @@ DuckDB database layer for QC Metrics Dashboard.
 Handles parquet loading, filtering, and box-plot statistics.
 """
 
+import contextlib
 import duckdb
+import functools
+from collections import OrderedDict
+import hashlib
 import math
+import threading
 
 # Default machines that always appear in the Machine dropdown
 DEFAULT_MACHINES = ['NovaSeq', 'MiSeq', 'NextSeq', 'Revio']
 
+# Lower-cased column names treated as the sample identifier
+SAMPLE_NAME_COLUMNS = ("sample_name", "sample", "samplename", "sample name")
+
+# Number of histogram bins returned per numerical column by get_stats
+HIST_BINS = 50
+
+# Jittered dots per column; larger selections are reservoir-sampled down to this
+MAX_POINTS = 5000
+
+# Filter states whose /stats results are kept (least recently used evicted)
+STATS_CACHE_SIZE = 128
+
+# Dots held across all cached /stats results; with many numerical columns
+# each entry carries up to MAX_POINTS per column, so fewer entries fit
+STATS_CACHE_MAX_POINTS = 2_000_000
+
 
 class QCDatabase:
     def __init__(self):
         self.conn = duckdb.connect(":memory:")
+        self._local = threading.local()
         self.loaded = False
         self.new_samples_loaded = False
         self.columns = {"categorical": [], "numerical": []}
         self.filter_options = {}
+        self.projections = {}
+        self.stats_cache = OrderedDict()     # filter key -> (stats, dot count)
+        self.stats_cache_points = 0
+        self.generation = 0                 # bumped whenever loaded data changes
+        self._cache_lock = threading.Lock()
+        self._state_cond = threading.Condition()   # guards views vs. readers
+        self._readers = 0
+        self._writers_waiting = 0
+        self.sources = {}                   # view name -> parquet path it reads
+        self.dataset_etag = ""
         self.total_rows = 0
         self.new_samples_rows = 0
+        self.new_samples_name_col = None
 
     # ── public API ──────────────────────────────────────────────
 
     def load_parquet(self, file_path: str) -> dict:
         """Load a parquet file, classify columns, extract filter options."""
-        self.conn.execute("DROP TABLE IF EXISTS qc_data")
-        self.conn.execute(
-            "CREATE TABLE qc_data AS SELECT * FROM read_parquet(?)", [file_path]
-        )
+        with self._writing():
+            self._create_parquet_view("qc_data", file_path)
 
-        # classify columns
-        col_info = self.conn.execute(
-            "SELECT column_name, data_type FROM information_schema.columns "
-            "WHERE table_name = 'qc_data'"
-        ).fetchall()
+            # classify columns
+            col_info = self._cursor().execute("DESCRIBE qc_data").fetchall()
 
-        categorical, numerical = [], []
-        for name, dtype in col_info:
-            if dtype in ("VARCHAR", "BOOLEAN") or "CHAR" in dtype or "TEXT" in dtype:
-                categorical.append(name)
-            else:
-                numerical.append(name)
+            categorical, numerical = [], []
+            for name, dtype, *_ in col_info:
+                if dtype in ("VARCHAR", "BOOLEAN") or "CHAR" in dtype or "TEXT" in dtype:
+                    categorical.append(name)
+                else:
+                    numerical.append(name)
 
-        self.columns = {"categorical": categorical, "numerical": numerical}
+            self.columns = {"categorical": categorical, "numerical": numerical}
 
-        # build filter options (skip sample-name-like cols – first categorical col)
-        filterable = [c for c in categorical if c.lower() not in ("sample_name", "sample", "samplename", "sample name")]
-        self.filter_options = {}
-        for col in filterable:
-            vals = self.conn.execute(
-                f'SELECT DISTINCT "{col}" FROM qc_data ORDER BY "{col}"'
-            ).fetchall()
-            data_values = [str(v[0]) for v in vals if v[0] is not None]
-            
-            # If this is the Machine column, merge defaults with data values
-            if col.lower() == 'machine':
-                combined = list(DEFAULT_MACHINES)  # Start with defaults
-                for val in data_values:
-                    if val not in combined:
-                        combined.append(val)
-                self.filter_options[col] = ["All"] + combined
-            else:
-                self.filter_options[col] = ["All"] + data_values
+            # build filter options (skip sample-name-like cols – first categorical col)
+            filterable = [c for c in categorical if c.lower() not in SAMPLE_NAME_COLUMNS]
+            self.filter_options = {}
+            # one scan for every filterable column instead of a DISTINCT query each
+            distinct_lists = []
+            if filterable:
+                distinct_sql = "SELECT " + ", ".join(
+                    f'list_sort(list(DISTINCT "{col}"))' for col in filterable
+                ) + " FROM qc_data"
+                distinct_lists = self._cursor().execute(distinct_sql).fetchone()
+            for col, vals in zip(filterable, distinct_lists):
+                data_values = [str(v) for v in (vals or []) if v is not None]
 
-        self.total_rows = self.conn.execute("SELECT COUNT(*) FROM qc_data").fetchone()[0]
-        self.loaded = True
+                # If this is the Machine column, merge defaults with data values
+                if col.lower() == 'machine':
+                    combined = list(DEFAULT_MACHINES)  # Start with defaults
+                    for val in data_values:
+                        if val not in combined:
+                            combined.append(val)
+                    self.filter_options[col] = ["All"] + combined
+                else:
+                    self.filter_options[col] = ["All"] + data_values
 
-        return {
-            "columns": self.columns,
-            "filter_options": self.filter_options,
-            "total_rows": self.total_rows,
-        }
+            self.projections["qc_data"] = self._finite_projection("qc_data")
+            self.total_rows = self._cursor().execute("SELECT COUNT(*) FROM qc_data").fetchone()[0]
+            self._invalidate_stats()
+            self._update_etag()
+            self.loaded = True
+
+            return {
+                "columns": self.columns,
+                "filter_options": self.filter_options,
+                "total_rows": self.total_rows,
+            }
 
     def load_new_samples(self, file_path: str) -> dict:
-        """Load a parquet file as new samples into a separate table."""
-        self.conn.execute("DROP TABLE IF EXISTS new_samples")
-        self.conn.execute(
-            "CREATE TABLE new_samples AS SELECT * FROM read_parquet(?)", [file_path]
-        )
-        self.new_samples_rows = self.conn.execute(
-            "SELECT COUNT(*) FROM new_samples"
-        ).fetchone()[0]
-        self.new_samples_loaded = True
+        """Load a parquet file as new samples into a separate view."""
+        with self._writing():
+            self._create_parquet_view("new_samples", file_path)
+            self.projections["new_samples"] = self._finite_projection("new_samples")
+            self.new_samples_name_col = self._detect_sample_name_col("new_samples")
+            self.new_samples_rows = self._cursor().execute(
+                "SELECT COUNT(*) FROM new_samples"
+            ).fetchone()[0]
+            self._invalidate_stats()
+            self._update_etag()
+            self.new_samples_loaded = True
 
-        return {
-            "total_rows": self.new_samples_rows,
-        }
+            return {
+                "total_rows": self.new_samples_rows,
+            }
 
     def clear_new_samples(self):
-        """Remove the new samples table."""
-        self.conn.execute("DROP TABLE IF EXISTS new_samples")
-        self.new_samples_loaded = False
-        self.new_samples_rows = 0
+        """Remove the new samples view."""
+        with self._writing():
+            self._cursor().execute("DROP VIEW IF EXISTS new_samples")
+            self.sources.pop("new_samples", None)
+            self.projections.pop("new_samples", None)
+            self._invalidate_stats()
+            self._update_etag()
+            self.new_samples_loaded = False
+            self.new_samples_rows = 0
+            self.new_samples_name_col = None
 
-    def query_data(self, filters: dict) -> dict:
-        """Return rows matching all filters (AND logic), plus new samples."""
-        data = []
-        new_data = []
-
-        if self.loaded:
-            where, params = self._build_where(filters)
-            sql = f"SELECT * FROM qc_data{where}"
-            result = self.conn.execute(sql, params)
-            cols = [desc[0] for desc in result.description]
-            rows = result.fetchall()
-            data = [self._row_to_dict(cols, r) for r in rows]
-
-        if self.new_samples_loaded:
-            where, params = self._build_where(filters)
-            try:
-                sql = f"SELECT * FROM new_samples{where}"
-                result = self.conn.execute(sql, params)
-                cols = [desc[0] for desc in result.description]
-                rows = result.fetchall()
-                new_data = [self._row_to_dict(cols, r) for r in rows]
-            except Exception:
-                # filter columns may not exist in new_samples; query without filters
-                result = self.conn.execute("SELECT * FROM new_samples")
-                cols = [desc[0] for desc in result.description]
-                rows = result.fetchall()
-                new_data = [self._row_to_dict(cols, r) for r in rows]
-
-        return {"data": data, "new_data": new_data}
-
-    def get_stats(self, filters: dict) -> dict:
-        """Return box-plot statistics for every numerical column."""
+    def query_data(self, filters: dict, _where: tuple | None = None) -> dict:
+        """Return rows matching all filters (AND logic), plus new samples.
+
+        Rows come back column-wise: ``{"columns": [...], "values": {col: [...]}}``.
+        ``_where`` may carry a pre-built ``(where, params)`` pair from _build_where.
+        """
+        data, count = {"columns": [], "values": {}}, 0
+        new_data, new_count = {"columns": [], "values": {}}, 0
+        where, params = _where or self._build_where(filters)
+
+        with self.reading():
+            if self.loaded:
+                sql = f"SELECT {self.projections['qc_data']} FROM qc_data{where}"
+                data, count = self._fetch_columns(sql, params)
+
+            if self.new_samples_loaded:
+                projection = self.projections["new_samples"]
+                try:
+                    sql = f"SELECT {projection} FROM new_samples{where}"
+                    new_data, new_count = self._fetch_columns(sql, params)
+                except Exception:
+                    # filter columns may not exist in new_samples; query without filters
+                    new_data, new_count = self._fetch_columns(f"SELECT {projection} FROM new_samples", [])
+
+            return {"data": data, "new_data": new_data, "count": count, "new_count": new_count}
+
+    def get_stats(self, filters: dict, _where: tuple | None = None) -> dict:
+        """Return box-plot statistics for every numerical column.
+
+        Results are memoised per filter state until the data changes, LRU-evicted
+        beyond STATS_CACHE_SIZE entries or STATS_CACHE_MAX_POINTS dots in total.
+        ``_where`` may carry a pre-built ``(where, params)`` pair from _build_where.
+        """
+        key = frozenset((col, val) for col, val in filters.items() if val and val != "All")
+        with self.reading():
+            with self._cache_lock:
+                if key in self.stats_cache:
+                    self.stats_cache.move_to_end(key)
+                    return self.stats_cache[key][0]
+            # holding the read side keeps loads out until the result is cached
+            stats = self._compute_stats(_where or self._build_where(filters))
+            size = sum(len(c["points"]) + len(c["new_points"]) for c in stats.values())
+            with self._cache_lock:
+                if key not in self.stats_cache:
+                    self.stats_cache[key] = (stats, size)
+                    self.stats_cache_points += size
+                while len(self.stats_cache) > 1 and (
+                    len(self.stats_cache) > STATS_CACHE_SIZE
+                    or self.stats_cache_points > STATS_CACHE_MAX_POINTS
+                ):
+                    _, (_, evicted) = self.stats_cache.popitem(last=False)
+                    self.stats_cache_points -= evicted
+            return stats
+
+    def _compute_stats(self, where_params: tuple) -> dict:
         if not self.loaded:
             return {}
-        where, params = self._build_where(filters)
+        where, params = where_params
+        numerical = self.columns["numerical"]
         stats = {}
-        for col in self.columns["numerical"]:
-            agg_sql = (
-                f'SELECT '
-                f'MIN("{col}") AS mn, '
-                f'PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY "{col}") AS q1, '
-                f'MEDIAN("{col}") AS med, '
-                f'PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY "{col}") AS q3, '
-                f'MAX("{col}") AS mx '
-                f'FROM qc_data{where}'
-            )
-            row = self.conn.execute(agg_sql, params).fetchone()
+        if not numerical:
+            return stats
+
+        agg_sql = self._summary_sql(tuple(numerical), where)
+        grouped = {metric: rest for metric, *rest in self._cursor().execute(agg_sql, params).fetchall()}
+        # columns with no finite values are dropped by UNPIVOT
+        summaries = {col: grouped.get(col, [None] * 5 + [0]) for col in numerical}
+        histograms = self._histograms(summaries, where, params)
+
+        for col in numerical:
+            row = summaries[col]
             if where:
-                pts_sql = f'SELECT "{col}" FROM qc_data{where} AND "{col}" IS NOT NULL'
+                pts_sql = f'SELECT TRY_CAST("{col}" AS DOUBLE) FROM qc_data{where} AND isfinite("{col}")'
             else:
-                pts_sql = f'SELECT "{col}" FROM qc_data WHERE "{col}" IS NOT NULL'
-            points = [p[0] for p in self.conn.execute(pts_sql, params).fetchall()]
+                pts_sql = f'SELECT TRY_CAST("{col}" AS DOUBLE) FROM qc_data WHERE isfinite("{col}")'
+            if row[5] > MAX_POINTS:
+                # the exact stats above cover every row; the dots only need the shape
+                pts_sql = f"SELECT * FROM ({pts_sql}) USING SAMPLE reservoir({MAX_POINTS} ROWS) REPEATABLE (0)"
+            points = [p[0] for p in self._cursor().execute(pts_sql, params).fetchall()]
 
             # new samples points (with sample names for tooltips)
             new_points = []
             if self.new_samples_loaded:
-                # detect sample name column in new_samples
-                ns_name_col = self._detect_sample_name_col("new_samples")
+                ns_name_col = self.new_samples_name_col
+                if ns_name_col:
+                    select_part = f'"{ns_name_col}", TRY_CAST("{col}" AS DOUBLE)'
+                else:
+                    select_part = f'TRY_CAST("{col}" AS DOUBLE)'
                 try:
-                    if ns_name_col:
-                        select_part = f'"{ns_name_col}", "{col}"'
-                    else:
-                        select_part = f'"{col}"'
                     if where:
-                        ns_sql = f'SELECT {select_part} FROM new_samples{where} AND "{col}" IS NOT NULL'
+                        ns_sql = f'SELECT {select_part} FROM new_samples{where} AND isfinite("{col}")'
                     else:
-                        ns_sql = f'SELECT {select_part} FROM new_samples WHERE "{col}" IS NOT NULL'
-                    rows_ns = self.conn.execute(ns_sql, params).fetchall()
+                        ns_sql = f'SELECT {select_part} FROM new_samples WHERE isfinite("{col}")'
+                    rows_ns = self._cursor().execute(ns_sql, params).fetchall()
                     if ns_name_col:
                         new_points = [{"name": str(r[0]), "value": r[1]} for r in rows_ns]
                     else:
                         new_points = [{"value": r[0]} for r in rows_ns]
                 except Exception:
                     try:
-                        if ns_name_col:
-                            ns_sql = f'SELECT "{ns_name_col}", "{col}" FROM new_samples WHERE "{col}" IS NOT NULL'
-                        else:
-                            ns_sql = f'SELECT "{col}" FROM new_samples WHERE "{col}" IS NOT NULL'
-                        rows_ns = self.conn.execute(ns_sql, []).fetchall()
+                        ns_sql = f'SELECT {select_part} FROM new_samples WHERE isfinite("{col}")'
+                        rows_ns = self._cursor().execute(ns_sql, []).fetchall()
                         if ns_name_col:
                             new_points = [{"name": str(r[0]), "value": r[1]} for r in rows_ns]
                         else:
@@ -186,11 +252,13 @@ class QCDatabase:
                     "median": self._safe_float(row[2]),
                     "q3": self._safe_float(row[3]),
                     "max": self._safe_float(row[4]),
-                    "points": [self._safe_float(p) for p in points],
-                    "new_points": [self._safe_float_obj(p) for p in new_points],
+                    "count": row[5],
+                    "histogram": histograms.get(col, {"bins": [], "counts": []}),
+                    "points": points,
+                    "new_points": new_points,
                 }
             else:
-                stats[col] = {"min": 0, "q1": 0, "median": 0, "q3": 0, "max": 0, "points": [], "new_points": [self._safe_float_obj(p) for p in new_points]}
+                stats[col] = {"min": 0, "q1": 0, "median": 0, "q3": 0, "max": 0, "count": 0, "histogram": {"bins": [], "counts": []}, "points": [], "new_points": new_points}
         return stats
 
     def get_filter_options(self) -> dict:
@@ -201,35 +269,187 @@ class QCDatabase:
 
     # ── helpers ──────────────────────────────────────────────────
 
+    def _cursor(self) -> duckdb.DuckDBPyConnection:
+        """Per-thread cursor on the shared database.
+
+        A DuckDB connection must not be used from several threads at once,
+        so each server worker thread gets its own cursor.
+        """
+        cur = getattr(self._local, "cursor", None)
+        if cur is None:
+            cur = self._local.cursor = self.conn.cursor()
+        return cur
+
+    @contextlib.contextmanager
+    def reading(self):
+        """Hold off loads and clears while the block reads the loaded data.
+
+        Any number of readers may run at once; _writing waits for all of them,
+        so a request never sees a view whose columns / projections don't match.
+        Re-entrant per thread, so routes can wrap several public calls.
+        """
+        depth = getattr(self._local, "read_depth", 0)
+        if not depth:
+            with self._state_cond:
+                # a waiting load goes first, or a busy server would starve it
+                self._state_cond.wait_for(lambda: not self._writers_waiting)
+                self._readers += 1
+        self._local.read_depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.read_depth = depth
+            if not depth:
+                with self._state_cond:
+                    self._readers -= 1
+                    if not self._readers:
+                        self._state_cond.notify_all()
+
+    @contextlib.contextmanager
+    def _writing(self):
+        """Exclusive access for replacing a view and the state derived from it."""
+        with self._state_cond:
+            self._writers_waiting += 1
+            self._state_cond.wait_for(lambda: self._readers == 0)
+            self._writers_waiting -= 1
+            try:
+                yield
+            finally:
+                self._state_cond.notify_all()
+
     def _build_where(self, filters: dict) -> tuple[str, list]:
         """Build a WHERE clause from filter dict; skip 'All' values."""
-        clauses, params = [], []
-        for col, val in filters.items():
-            if val and val != "All":
-                clauses.append(f'"{col}" = ?')
-                params.append(val)
-        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
-        return where, params
+        active = {col: val for col, val in filters.items() if val and val != "All"}
+        # the clause only depends on which columns are filtered, so the
+        # statements built on top of it can be cached per filter shape
+        shape = tuple(sorted(active))
+        return self._where_sql(shape), [active[col] for col in shape]
 
     @staticmethod
-    def _row_to_dict(cols: list[str], row: tuple) -> dict:
-        d = {}
-        for c, v in zip(cols, row):
-            if isinstance(v, float) and (math.isnan(v) or math.isinf(v)):
-                d[c] = None
-            else:
-                d[c] = v
-        return d
+    @functools.lru_cache(maxsize=128)
+    def _where_sql(shape: tuple) -> str:
+        """WHERE clause for a sorted tuple of filtered columns."""
+        if not shape:
+            return ""
+        return " WHERE " + " AND ".join(f'"{col}" = ?' for col in shape)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _summary_sql(numerical: tuple, where: str) -> str:
+        """One row per numerical column: metric, min, q1, median, q3, max, count of finite values."""
+        finite = QCDatabase._finite
+        values = ", ".join(f'TRY_CAST({finite(col)} AS DOUBLE) AS "{col}"' for col in numerical)
+        on = ", ".join(f'"{col}"' for col in numerical)
+        return (
+            "SELECT metric, MIN(v), "
+            "APPROX_QUANTILE(v, 0.25), "
+            "APPROX_QUANTILE(v, 0.5), "
+            "APPROX_QUANTILE(v, 0.75), "
+            "MAX(v), COUNT(v) "
+            f"FROM (UNPIVOT (SELECT {values} FROM qc_data{where}) "
+            f"ON {on} INTO NAME metric VALUE v) "
+            "GROUP BY metric"
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _histogram_sql(cols: tuple, where: str) -> str:
+        """Histogram bucket counts for every column; takes (lo, width) params per column."""
+        finite = QCDatabase._finite
+        aggs = [
+            f'histogram(LEAST(CAST(FLOOR(({finite(col)} - ?::DOUBLE) / ?::DOUBLE) AS INTEGER), {HIST_BINS - 1})) '
+            f'FILTER (WHERE isfinite("{col}")) AS h{i}'
+            for i, col in enumerate(cols)
+        ]
+        return (
+            "SELECT " + ", ".join(f"map_keys(h{i}), map_values(h{i})" for i in range(len(cols)))
+            + " FROM (SELECT " + ", ".join(aggs) + f" FROM qc_data{where})"
+        )
+
+    def _histograms(self, summaries: dict, where: str, params: list) -> dict:
+        """Bin every numerical column into HIST_BINS equal-width buckets in one scan."""
+        edges = {}
+        for col, row in summaries.items():
+            lo, hi = self._safe_float(row[0]), self._safe_float(row[4])
+            # a single distinct value has no spread to bin; send no histogram
+            if lo is not None and hi is not None and hi > lo:
+                edges[col] = (lo, (hi - lo) / HIST_BINS)
+        if not edges:
+            return {}
+
+        hist_params = [p for lo_width in edges.values() for p in lo_width]
+        hist_sql = self._histogram_sql(tuple(edges), where)
+        hist_row = self._cursor().execute(hist_sql, hist_params + params).fetchone()
+
+        histograms = {}
+        for i, (col, (lo, width)) in enumerate(edges.items()):
+            counts = [0] * HIST_BINS
+            for bucket, n in zip(hist_row[i * 2] or [], hist_row[i * 2 + 1] or []):
+                counts[bucket] = n
+            histograms[col] = {
+                "bins": [lo + b * width for b in range(HIST_BINS + 1)],
+                "counts": counts,
+            }
+        return histograms
+
+    def _invalidate_stats(self):
+        """Drop cached stats after the loaded data changed."""
+        with self._cache_lock:
+            self.generation += 1
+            self.stats_cache.clear()
+            self.stats_cache_points = 0
+
+    def _create_parquet_view(self, name: str, file_path: str):
+        """(Re)point a view at a parquet file.
+
+        Nothing is copied: DuckDB decodes only the columns and row groups each
+        query touches. The path is inlined because views cannot take parameters.
+        """
+        path_literal = "'" + file_path.replace("'", "''") + "'"
+        self._cursor().execute(
+            f"CREATE OR REPLACE VIEW {name} AS SELECT * FROM read_parquet({path_literal})"
+        )
+        self.sources[name] = file_path
+
+    def _update_etag(self):
+        """Recompute dataset_etag after a load or clear.
+
+        Upload paths carry a fresh uuid and generation grows on every change,
+        so two loads never share a tag even when their files look alike.
+        """
+        sources = ":".join(f"{t}={path}" for t, path in sorted(self.sources.items()))
+        self.dataset_etag = hashlib.md5(f"{self.generation}:{sources}".encode()).hexdigest()
+
+    def _fetch_columns(self, sql: str, params: list) -> tuple[dict, int]:
+        """Run a query through Arrow; return its columns as lists and the row count."""
+        table = self._cursor().execute(sql, params).fetch_arrow_table()
+        return {"columns": table.column_names, "values": table.to_pydict()}, table.num_rows
+
+    def _finite_projection(self, table: str) -> str:
+        """SELECT list for a table with NaN / Inf floats mapped to NULL."""
+        col_info = self._cursor().execute(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_name = ? ORDER BY ordinal_position", [table]
+        ).fetchall()
+        return ", ".join(
+            f'{self._finite(name)} AS "{name}"' if dtype in ("FLOAT", "DOUBLE") else f'"{name}"'
+            for name, dtype in col_info
+        )
+
+    @staticmethod
+    def _finite(col: str) -> str:
+        """SQL expression yielding a column's value, or NULL when not finite."""
+        return f'CASE WHEN isfinite("{col}") THEN "{col}" END'
 
     def _detect_sample_name_col(self, table: str) -> str | None:
         """Find the sample-name-like column in a table."""
         try:
-            col_info = self.conn.execute(
+            col_info = self._cursor().execute(
                 f"SELECT column_name FROM information_schema.columns "
                 f"WHERE table_name = '{table}'"
             ).fetchall()
             for (name,) in col_info:
-                if name.lower() in ("sample_name", "sample", "samplename", "sample name"):
+                if name.lower() in SAMPLE_NAME_COLUMNS:
                     return name
         except Exception:
             pass
@@ -242,23 +462,3 @@ class QCDatabase:
             return None if (math.isnan(f) or math.isinf(f)) else f
         except (TypeError, ValueError):
             return None
-
-    @staticmethod
-    def _safe_float_obj(obj):
-        """Safe-float for {name, value} dict objects."""
-        if isinstance(obj, dict):
-            try:
-                f = float(obj["value"])
-                val = None if (math.isnan(f) or math.isinf(f)) else f
-            except (TypeError, ValueError):
-                val = None
-            result = {"value": val}
-            if "name" in obj:
-                result["name"] = obj["name"]
-            return result
-        # fallback for plain numbers
-        try:
-            f = float(obj)
-            return {"value": None if (math.isnan(f) or math.isinf(f)) else f}
-        except (TypeError, ValueError):
-            return {"value": None}
@@ -170,34 +170,63 @@ function buildBackendFilters() {
   return mapped;
 }
 
+/* ── /dashboard_state responses by filter state, revalidated via ETag ── */
+const dashboardCache = new Map();            // JSON(filters) → { etag, json }
+const DASHBOARD_CACHE_SIZE = 16;             // most recent filter states kept
+
 /**
- * Read current filter state, fetch filtered data & stats.
+ * Read current filter state, fetch filtered data & stats in one request.
  */
 async function applyFilters() {
   const filters = buildBackendFilters();
+  const cacheKey = JSON.stringify(filters);
+  const cached = dashboardCache.get(cacheKey);
+  if (cached) {                              // re-insert to mark as most recent
+    dashboardCache.delete(cacheKey);
+    dashboardCache.set(cacheKey, cached);
+  }
+  // drop the previous state's stats so a failed request can't leave them on screen
+  window.appState.currentStats = null;
   showLoading();
 
   try {
-    // fetch table data
-    const res  = await fetch('/query', {
+    // table rows, plot stats and filter options from a single round trip
+    const headers = { 'Content-Type': 'application/json' };
+    if (cached) headers['If-None-Match'] = cached.etag;
+    const res  = await fetch('/dashboard_state', {
       method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
+      headers,
       body: JSON.stringify({ filters }),
     });
-    const json = await res.json();
+
+    let json;
+    if (res.status === 304 && cached) {
+      json = cached.json;                      // unchanged since last fetch
+    } else {
+      json = await res.json();
+      const etag = res.headers.get('ETag');
+      if (res.ok && etag) {
+        dashboardCache.delete(cacheKey);
+        dashboardCache.set(cacheKey, { etag, json });
+        if (dashboardCache.size > DASHBOARD_CACHE_SIZE) {
+          dashboardCache.delete(dashboardCache.keys().next().value);
+        }
+      }
+    }
 
     if (json.error) { alert(json.error); return; }
 
     window.appState.currentData = json.data;
-    window.appState.newSamplesData = json.new_data || [];
-    renderTable(json.data, window.appState.columns, json.new_data || []);
+    window.appState.newSamplesData = json.new_data || null;
+    window.appState.currentStats = json.stats;
+    renderTable(json.data, window.appState.columns, json.new_data);
     updateRowCount(json.count, json.total, json.new_count || 0);
     updateFilterBanner();
 
     // if visualisation tab is visible, refresh plots immediately
     const plotsTab = document.getElementById('tab-plots');
     if (plotsTab.classList.contains('active')) {
-      await updateVisualizations();
+      renderPlots(json.stats);
     }
   } catch (err) {
     console.error('Filter error:', err);
@@ -207,9 +236,13 @@ async function applyFilters() {
 }
 
 /**
- * Fetch box-plot stats and render plots.
+ * Render box-plot stats, fetching them only if applyFilters hasn't yet.
  */
 async function updateVisualizations() {
+  if (window.appState.currentStats) {
+    renderPlots(window.appState.currentStats);
+    return;
+  }
   const filters = buildBackendFilters();
 
   try {
@@ -220,6 +253,7 @@ async function updateVisualizations() {
     });
     const stats = await res.json();
     if (stats.error) { console.error(stats.error); return; }
+    window.appState.currentStats = stats;
     renderPlots(stats);
   } catch (err) {
     console.error('Stats error:', err);
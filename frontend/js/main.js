@@ -8,8 +8,9 @@ window.appState = {
   columns: { categorical: [], numerical: [] },
   filterOptions: {},        // { Machine: ["All","NovaSeq",…], … }
   currentFilters: {},       // { Machine: "All", Assay: "All", … }
-  currentData: [],
-  newSamplesData: [],
+  currentData: null,        // { columns: [...], values: { col: [...] } }
+  currentStats: null,       // /stats payload for the current filters
+  newSamplesData: null,
   newSamplesFile: null,
   totalRows: 0,
 };
@@ -158,7 +159,7 @@ clearNewSamplesBtn.addEventListener('click', async () => {
   try {
     await fetch('/clear-new-samples', { method: 'POST' });
     window.appState.newSamplesFile = null;
-    window.appState.newSamplesData = [];
+    window.appState.newSamplesData = null;
     newSamplesStatus.textContent = '';
     clearNewSamplesBtn.style.display = 'none';
     await applyFilters();
@@ -4,7 +4,7 @@
 
 /**
  * Render one box-and-whisker plot per numerical column.
- * @param {Object} statsData – { colName: {min, q1, median, q3, max, points}, … }
+ * @param {Object} statsData – { colName: {min, q1, median, q3, max, count, histogram, points}, … }
  */
 function renderPlots(statsData) {
   const grid = document.getElementById('plot-grid');
@@ -56,7 +56,7 @@ function renderPlots(statsData) {
 /* ── Box-and-whisker plot ──────────────────────────────── */
 
 function renderBoxPlot(container, colName, data) {
-  if (!data.points || data.points.length === 0) {
+  if (!data.count) {
     const msg = document.createElement('p');
     msg.textContent = 'No data';
     msg.style.textAlign = 'center';
@@ -68,15 +68,37 @@ function renderBoxPlot(container, colName, data) {
   const margin = { top: 10, right: 30, bottom: 35, left: 60 };
   const width  = 380 - margin.left - margin.right;
   const height = 300 - margin.top  - margin.bottom;
+  const fullW  = width + margin.left + margin.right;
+  const fullH  = height + margin.top + margin.bottom;
 
-  const svg = d3.select(container)
+  // layers, bottom to top: SVG (axes, histogram, box), canvas (database
+  // dots), overlay SVG (interactive new-sample dots) – same order as when
+  // everything was drawn in one SVG
+  const wrap = d3.select(container)
+    .append('div')
+      .attr('class', 'plot-canvas-wrap');
+
+  const ratio  = window.devicePixelRatio || 1;
+  const canvas = wrap.append('canvas')
+    .attr('width', fullW * ratio)
+    .attr('height', fullH * ratio);
+
+  const svg = wrap
     .append('svg')
-      .attr('viewBox', `0 0 ${width + margin.left + margin.right} ${height + margin.top + margin.bottom}`)
+      .attr('viewBox', `0 0 ${fullW} ${fullH}`)
       .attr('preserveAspectRatio', 'xMidYMid meet')
       .attr('width', '100%')
     .append('g')
       .attr('transform', `translate(${margin.left},${margin.top})`);
 
+  const overlay = wrap
+    .append('svg')
+      .attr('class', 'plot-overlay')
+      .attr('viewBox', `0 0 ${fullW} ${fullH}`)
+      .attr('preserveAspectRatio', 'xMidYMid meet')
+    .append('g')
+      .attr('transform', `translate(${margin.left},${margin.top})`);
+
   // ── Y scale ────────────────────────────────────────────
   const [yMin, yMax] = yDomainFor(colName, data);
   const y = d3.scaleLinear().domain([yMin, yMax]).nice().range([height, 0]);
@@ -96,6 +118,25 @@ function renderBoxPlot(container, colName, data) {
   const xC    = width / 2;
   const boxW  = 70;
 
+  // ── distribution (mirrored histogram, violin-style) ────
+  const hist = data.histogram || { bins: [], counts: [] };
+  const maxCount = d3.max(hist.counts) || 0;
+  const hasSpread = hist.bins.length > 1 && hist.bins[0] !== hist.bins[hist.bins.length - 1];
+  if (maxCount > 0 && hasSpread) {
+    const halfW = boxW * 0.9;
+    const area = d3.area()
+      .curve(d3.curveStepBefore)
+      .y(d => y(d))
+      .x0((d, i) => xC - ((hist.counts[i] || 0) / maxCount) * halfW)
+      .x1((d, i) => xC + ((hist.counts[i] || 0) / maxCount) * halfW);
+    svg.append('path')
+      .datum(hist.bins)
+      .attr('d', area)
+      .attr('fill', 'rgba(148,163,184,0.25)')
+      .attr('stroke', '#94a3b8')
+      .attr('stroke-width', 0.75);
+  }
+
   // ── whisker (min→max) ──────────────────────────────────
   svg.append('line')
     .attr('x1', xC).attr('x2', xC)
@@ -127,20 +168,22 @@ function renderBoxPlot(container, colName, data) {
     .attr('y1', y(data.median)).attr('y2', y(data.median))
     .attr('stroke', '#dc2626').attr('stroke-width', 2.5);
 
-  // ── jittered dots (database – rose) ────────────────────
+  // ── jittered dots (database – rose, on canvas) ─────────
+  // thousands of points are much cheaper as pixels than as SVG nodes
   const jitterW = boxW * 0.75;
-  svg.selectAll('.dot-db')
-    .data(data.points)
-    .enter()
-    .append('circle')
-      .attr('class', 'dot-db')
-      .attr('cx', () => xC + (Math.random() - 0.5) * jitterW)
-      .attr('cy', d  => y(d))
-      .attr('r', 3.5)
-      .attr('fill', '#e11d48')
-      .attr('opacity', 0.45)
-      .attr('stroke', '#fff')
-      .attr('stroke-width', 0.5);
+  const ctx = canvas.node().getContext('2d');
+  ctx.scale(ratio, ratio);
+  ctx.translate(margin.left, margin.top);
+  ctx.globalAlpha = 0.45;
+  ctx.fillStyle   = '#e11d48';
+  ctx.strokeStyle = '#fff';
+  ctx.lineWidth   = 0.5;
+  (data.points || []).forEach(d => {
+    ctx.beginPath();
+    ctx.arc(xC + (Math.random() - 0.5) * jitterW, y(d), 3.5, 0, 2 * Math.PI);
+    ctx.fill();
+    ctx.stroke();
+  });
 
   // ── jittered dots (new samples – blue, with tooltips) ──
   if (data.new_points && data.new_points.length > 0) {
@@ -152,7 +195,7 @@ function renderBoxPlot(container, colName, data) {
         .attr('class', 'plot-tooltip');
     }
 
-    svg.selectAll('.dot-ns')
+    overlay.selectAll('.dot-ns')
       .data(data.new_points)
       .enter()
       .append('circle')
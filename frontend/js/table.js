@@ -6,17 +6,20 @@ let _headerBuilt = false;
 
 /**
  * Render the data table.
- * @param {Array<Object>} data     – Row objects from /query (database)
- * @param {Object}        cols     – { categorical: [...], numerical: [...] }
- * @param {Array<Object>} newData  – Row objects from new samples (optional)
+ * @param {Object} data     – Columnar block from /query: { columns: [...], values: { col: [...] } }
+ * @param {Object} cols     – { categorical: [...], numerical: [...] }
+ * @param {Object} newData  – Columnar block for new samples (optional)
  */
 function renderTable(data, cols, newData) {
   const thead = document.getElementById('table-head');
   const tbody = document.getElementById('table-body');
   const placeholder = document.getElementById('table-placeholder');
-  newData = newData || [];
+  data    = data    || { columns: [], values: {} };
+  newData = newData || { columns: [], values: {} };
+  const nRows    = blockLength(data);
+  const nNewRows = blockLength(newData);
 
-  if ((!data || data.length === 0) && newData.length === 0) {
+  if (nRows === 0 && nNewRows === 0) {
     tbody.innerHTML = '';
     if (!_headerBuilt) thead.innerHTML = '';
     placeholder.style.display = 'block';
@@ -26,8 +29,7 @@ function renderTable(data, cols, newData) {
   placeholder.style.display = 'none';
 
   // use columns from whichever dataset has data
-  const sampleRow = data.length > 0 ? data[0] : newData[0];
-  const allCols  = Object.keys(sampleRow);
+  const allCols  = nRows > 0 ? data.columns : newData.columns;
   const numSet   = new Set(cols.numerical);
 
   // ── build header once (or rebuild if columns changed) ─────
@@ -47,11 +49,11 @@ function renderTable(data, cols, newData) {
   tbody.innerHTML = '';
 
   // database rows
-  data.forEach(row => {
+  for (let i = 0; i < nRows; i++) {
     const tr = document.createElement('tr');
     allCols.forEach(col => {
       const td = document.createElement('td');
-      const val = row[col];
+      const val = data.values[col] ? data.values[col][i] : null;
 
       if (val == null) {
         td.textContent = '—';
@@ -64,15 +66,15 @@ function renderTable(data, cols, newData) {
       tr.appendChild(td);
     });
     tbody.appendChild(tr);
-  });
+  }
 
   // new samples rows (blue-tinted)
-  newData.forEach(row => {
+  for (let i = 0; i < nNewRows; i++) {
     const tr = document.createElement('tr');
     tr.classList.add('new-sample-row');
     allCols.forEach(col => {
       const td = document.createElement('td');
-      const val = row[col];
+      const val = newData.values[col] ? newData.values[col][i] : null;
 
       if (val == null) {
         td.textContent = '—';
@@ -85,7 +87,15 @@ function renderTable(data, cols, newData) {
       tr.appendChild(td);
     });
     tbody.appendChild(tr);
-  });
+  }
+}
+
+/**
+ * Number of rows in a columnar { columns, values } block.
+ */
+function blockLength(block) {
+  if (!block.columns || block.columns.length === 0) return 0;
+  return (block.values[block.columns[0]] || []).length;
 }
 
 /**